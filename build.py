@@ -1,5 +1,56 @@
+import importlib.machinery
 import os
 import subprocess
+import sys
+
+def compile_converter():
+    """
+    Compile converter.py into a native extension module with Cython
+    
+    Cython compiles the unmodified converter.py source, so the extension is a
+    drop-in replacement: Python imports it in preference to converter.py when
+    it exists and uses the pure Python module otherwise. The step is skipped
+    when Cython or a C compiler is not available. The extension is only meant
+    for PyInstaller, so remove_compiled_converter() deletes it again after the
+    build.
+    
+    Returns:
+        bool: True if the extension was built, False otherwise
+    """
+    try:
+        from Cython.Build import cythonize
+        from setuptools import Extension, setup
+    except ImportError:
+        print("Cython not installed, using the pure Python converter module")
+        return False
+    
+    # MSVC already optimizes release builds; other compilers get -O3
+    extra_compile_args = [] if sys.platform.startswith('win') else ['-O3']
+    extension = Extension('converter', ['converter.py'], extra_compile_args=extra_compile_args)
+    
+    try:
+        setup(
+            name='converter',
+            ext_modules=cythonize([extension], compiler_directives={'language_level': 3}),
+            script_args=['build_ext', '--inplace']
+        )
+    except (Exception, SystemExit) as e:
+        print(f"Converter extension build failed, using the pure Python module: {e}")
+        return False
+    
+    return True
+
+def remove_compiled_converter():
+    """
+    Remove the compiled converter extension and its generated C source
+    
+    The extension is built next to converter.py, where it would shadow the
+    source for run.py and gui_app.py and hide any later edits to converter.py.
+    """
+    for suffix in importlib.machinery.EXTENSION_SUFFIXES + ['.c']:
+        path = 'converter' + suffix
+        if os.path.exists(path):
+            os.remove(path)
 
 def create_exe():
     """
@@ -117,4 +168,8 @@ exe = EXE(
     print("Build complete! The executable file is located in the dist directory")
 
 if __name__ == "__main__":
-    create_exe()
\ No newline at end of file
+    compile_converter()
+    try:
+        create_exe()
+    finally:
+        remove_compiled_converter()
\ No newline at end of file
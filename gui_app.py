@@ -29,6 +29,7 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import converter
 import json
+import multiprocessing
 import threading
 from rich.console import Console
 import subprocess
@@ -1124,4 +1125,6 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    # Required for converter worker processes in the frozen executable
+    multiprocessing.freeze_support()
     main()
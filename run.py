@@ -42,10 +42,10 @@ TRANSLATIONS = {
         "de": "Python-Umgebung wird überprüft..."
     },
     "python_version_error": {
-        "zh": "錯誤：需要 Python 3.6 或更新版本",
-        "en": "Error: Python 3.6 or newer is required",
-        "es": "Error: Se requiere Python 3.6 o una versión más reciente",
-        "de": "Fehler: Python Version 3.6 ist erforderlich"
+        "zh": "錯誤：需要 Python 3.7 或更新版本",
+        "en": "Error: Python 3.7 or newer is required",
+        "es": "Error: Se requiere Python 3.7 o una versión más reciente",
+        "de": "Fehler: Python Version 3.7 ist erforderlich"
     },
     "installing_package": {
         "zh": "正在安裝必要套件 {}...",
@@ -312,8 +312,8 @@ def find_convertible_files(directory):
             if file.lower().endswith('.json'):
                 file_path = os.path.join(root, file)
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        json_data = json.load(f)
+                    # Parse with the converter's loader, which uses orjson when available
+                    json_data = converter.load_json_file(file_path)
                     
                     # Check if file has overrides
                     if "overrides" in json_data:
@@ -406,7 +406,7 @@ def main(lang="zh"):
     """
     # Check Python version
     console.print(f"[cyan]{get_text('checking_python', lang)}[/cyan]")
-    if sys.version_info < (3, 6):
+    if sys.version_info < (3, 7):
         console.print(Panel(
             get_text("python_version_error", lang),
             style="red",
@@ -516,7 +516,7 @@ def main(lang="zh"):
             console.print("\n", table)
 
             # Show output file information
-            console.print(f"\n[cyan]{get_text('converted_files_count', lang, len(processed_files))}[/cyan]")
+            console.print(f"\n[cyan]{get_text('converted_files_count', lang, len(processed_files.paths))}[/cyan]")
             console.print(f"[cyan]{get_text('output_file', lang)}: {output_zip}[/cyan]")
 
             return True